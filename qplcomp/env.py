@@ -110,6 +110,10 @@ class Env:
         '''
         self._lib : Dict[str, Expr] = {}
 
+        # the index from id(expr) to the first key defining it, for the lookup in `append`
+        # (Expr compares by identity, and the expressions are kept alive by self._lib)
+        self._keys : Dict[int, str] = {}
+
         # the number for auto naming
         self._numbering = 0
 
@@ -137,12 +141,13 @@ class Env:
         if not isinstance(expr, Expr):
             raise ValueError("Invalid value. Only Expr instances are allowed.")
         
-        for key in self._lib:
-            if self._lib[key] == expr:
-                return key
+        key = self._keys.get(id(expr))
+        if key is not None:
+            return key
             
         name = self.get_name()
         self._lib[name] = expr
+        self._keys[id(expr)] = name
         return name
     
     def __setitem__(self, key : str, expr : Expr) -> None:
@@ -154,6 +159,7 @@ class Env:
             raise ValueError("The variable '" + str(key) + "' has been defined.")
 
         self._lib[key] = expr
+        self._keys.setdefault(id(expr), key)
 
     def __getitem__(self, key : str) -> Expr:
         return self._lib[key]
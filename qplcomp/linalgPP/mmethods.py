@@ -3,7 +3,7 @@ import numpy as np
 
 from .general import close_zero, close_equal
 
-from .vmethods import v_normalized, v_complex_dot
+from .vmethods import v_normalized
 
 def column_simplest(A : np.ndarray, precision : float) -> np.ndarray:
     '''
@@ -67,27 +67,46 @@ def column_space(A : np.ndarray, precision : float) -> np.ndarray:
 
     # get the space dimension
     dim = A.shape[0]
-    ortho = np.array([]).reshape((dim, 0))
+
+    # the basis has at most `dim` vectors, so the buffer is allocated once
+    dtype = np.result_type(A.dtype, np.float64)
+    ortho = np.empty((dim, min(dim, A.shape[1])), dtype=dtype)
+    # the number of basis vectors found
+    k = 0
+
+    # scratch buffers reused by all the projections
+    veci = np.empty(dim, dtype=dtype)
+    veci_conj = np.empty(dim, dtype=dtype)
+    proj = np.empty(dim, dtype=dtype)
+    coeffs_buf = np.empty(ortho.shape[1], dtype=dtype)
 
     # Schmidt decomposition algorithm
     for i in range(A.shape[1]):
         # check whether it is already the whole space
-        if ortho.shape[1] == dim:
+        if k == dim:
             break
 
-        veci = A[:,i]
+        veci[:] = A[:,i]
+        basis = ortho[:, :k]
+        coeffs = coeffs_buf[:k]
 
         # subtract the projector within the existing space
-        for j in range(ortho.shape[1]):
-            proj_val = v_complex_dot(veci, ortho[:,j])
-            veci = veci - proj_val * ortho[:,j]
+        # (projected twice, so that the orthogonality is kept for nearly dependent vectors)
+        for _ in range(2):
+            # coeffs = basis^dagger @ veci, conjugating the vectors instead of the basis
+            np.conj(veci, out=veci_conj)
+            np.matmul(veci_conj, basis, out=coeffs)
+            np.conj(coeffs, out=coeffs)
+
+            np.matmul(basis, coeffs, out=proj)
+            np.subtract(veci, proj, out=veci)
 
         # check whether the result is zero
         if not close_zero(veci, precision):
-            veci_normalized = v_normalized(veci)
-            ortho = np.hstack((ortho, veci_normalized.reshape((dim, 1))))
+            ortho[:, k] = v_normalized(veci)
+            k += 1
     
-    return ortho
+    return ortho[:, :k].copy()
 
 
 def row_space(A : np.ndarray, precision: float) -> np.ndarray:
@@ -186,6 +205,29 @@ def is_Hermitian(A : np.ndarray, precision : float) -> bool:
     
     return True
 
+# the smallest dimension for which `is_spd` tries `cholesky_spd` first
+# (below it, the single eigvalsh call is faster even on acceptance)
+CHOLESKY_MIN_DIM = 16
+
+def cholesky_spd(A : np.ndarray, precision : float) -> bool:
+    '''
+    A quick sufficient check of whether the Hermitian matrix A is semi-positive definite, up to the precision.
+    It tries the Cholesky decomposition of `A + precision * I`, which is cheaper than the eigenvalues.
+
+    Note: a failure does not always mean that A is not semi-positive definite (because of the rounding near the boundary), and the eigenvalues should be checked then.
+
+    Parameters:
+        - A : np.ndarray, a Hermitian matrix.
+        - precision : float.
+    Returns: bool, True if the decomposition succeeds.
+    '''
+    try:
+        np.linalg.cholesky(A + precision * np.eye(A.shape[0]))
+    except np.linalg.LinAlgError:
+        return False
+    
+    return True
+
 def is_pdo(A : np.ndarray, precision : float) -> bool:
     '''
     Check whether matrix `A` can be considered as a partial density operator. That is, `A` is semipositive definite and `tr(A) <= 1`.
@@ -213,10 +255,15 @@ def is_spd(A : np.ndarray, precision : float):
     '''
     if not is_Hermitian(A, precision):
         return False
+    
+    # the fast path on acceptance for large operators
+    if A.shape[0] >= CHOLESKY_MIN_DIM and cholesky_spd(A, precision):
+        return True
 
-    e_vals = np.linalg.eigvals(A)
+    # eigenvalues of the Hermitian A, real and in ascending order
+    e_vals = np.linalg.eigvalsh(A)
 
-    if np.any(e_vals < 0 - precision):
+    if e_vals[0] < 0 - precision:
         return False
     else:
         return True
@@ -234,9 +281,10 @@ def Loewner_le(A : np.ndarray, B : np.ndarray, precision : float):
 
     '''
 
-    e_vals = np.linalg.eigvals(B - A)
+    # eigenvalues of the Hermitian B - A, real and in ascending order
+    e_vals = np.linalg.eigvalsh(B - A)
 
-    if np.any(e_vals < 0 - precision):
+    if e_vals[0] < 0 - precision:
         return False
     else:
         return True
@@ -256,8 +304,9 @@ def is_effect(A : np.ndarray, precision : float) -> bool:
         return False
 
     # check 0 <= matrix <= I
-    e_vals = np.linalg.eigvals(A)
-    if np.any(e_vals < 0 - precision) or np.any(e_vals > 1 + precision):
+    # eigenvalues of the Hermitian A, real and in ascending order
+    e_vals = np.linalg.eigvalsh(A)
+    if e_vals[0] < 0 - precision or e_vals[-1] > 1 + precision:
         return False
         
     return True
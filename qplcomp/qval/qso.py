@@ -12,11 +12,7 @@ from .qopt import QOpt
 from .val import QVal
 
 def Kraus_str(ls : List[QOpt]) -> str:
-    res = "{ " + str(ls[0])
-    for i in range(1, len(ls)):
-        res += ", " + str(ls[i])
-    res += " }"
-    return res
+    return "{ " + ", ".join(str(E) for E in ls) + " }"
 
 
 class QSOpt(QVal):
@@ -35,14 +35,7 @@ class QVar:
         '''
         Return the formatting of [qvls] as qvar.
         '''
-        if len(qvls) == 0:
-            return "[]"
-        
-        r = "[" + qvls[0]
-        for i in range(1, len(qvls)):
-            r += " " + qvls[i]
-        
-        return r + "]"
+        return "[" + " ".join(qvls) + "]"
 
 
     
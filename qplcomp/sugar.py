@@ -10,10 +10,13 @@ def type_check(obj : object, target_type : Type | Tuple[Type, ...]) -> None:
     '''
     The method to check the type of this object. It will raise a TypeError if the type of expr is not target_type.
     '''
+    # exact type matches are the common case, and skip the MRO walk of isinstance
+    if type(obj) is target_type:
+        return
+
     if isinstance(target_type, tuple):
-        for t in target_type:
-            if isinstance(obj, t):
-                return
+        if type(obj) in target_type or isinstance(obj, target_type):
+            return
         
         raise TypeError("The parameter expression '" + str(obj) + "' should be within type '" + str(target_type) + "', but is of type '"+ str(type(obj)) + "'.")
 
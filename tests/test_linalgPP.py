@@ -0,0 +1,77 @@
+from qplcomp import linalgPP
+import numpy as np
+
+prec = 1e-10
+
+def check_orthonormal_basis(A : np.ndarray, ortho : np.ndarray, rank : int):
+    '''
+    Check that the columns of `ortho` are an orthonormal basis of the column space of `A`.
+    '''
+    assert ortho.shape == (A.shape[0], rank)
+    assert linalgPP.close_equal(ortho.transpose().conj() @ ortho, np.eye(rank), prec)
+
+    # A is unchanged by the projection onto the basis
+    assert linalgPP.close_equal(ortho @ ortho.transpose().conj() @ A, A, prec)
+
+def test_column_space_01():
+    A = np.array(
+        [[1., 1., 0.],
+         [0., 1., 1.],
+         [0., 0., 0.]]
+    )
+    check_orthonormal_basis(A, linalgPP.column_space(A, prec), 2)
+
+def test_column_space_02():
+    # linear dependent columns, complex entries
+    v = np.array([1., 1j, 0., -1.])
+    u = np.array([0., 1., 1j, 0.])
+    A = np.stack([v, u, v + 2j * u, 3 * u], axis = 1)
+    check_orthonormal_basis(A, linalgPP.column_space(A, prec), 2)
+
+def test_column_space_03():
+    A = np.zeros((4, 3))
+    assert linalgPP.column_space(A, prec).shape == (4, 0)
+
+def test_column_space_04():
+    rng = np.random.default_rng(0)
+    A = rng.normal(size = (8, 12)) + 1j * rng.normal(size = (8, 12))
+    check_orthonormal_basis(A, linalgPP.column_space(A, prec), 8)
+
+def test_is_spd():
+    assert linalgPP.is_spd(np.array([[0.5, 0.5j], [-0.5j, 0.5]]), prec)
+    assert linalgPP.is_spd(np.zeros((2, 2)), prec)
+    assert not linalgPP.is_spd(np.array([[1., 0.], [0., -1.]]), prec)
+    # not Hermitian
+    assert not linalgPP.is_spd(np.array([[1., 1.], [0., 1.]]), prec)
+
+def test_is_effect():
+    assert linalgPP.is_effect(np.array([[0.5, 0.5], [0.5, 0.5]]), prec)
+    assert linalgPP.is_effect(np.eye(4), prec)
+    assert not linalgPP.is_effect(2 * np.eye(2), prec)
+    assert not linalgPP.is_effect(-np.eye(2), prec)
+
+def test_Loewner_le():
+    P0 = np.array([[1., 0.], [0., 0.]])
+    assert linalgPP.Loewner_le(P0, np.eye(2), prec)
+    assert not linalgPP.Loewner_le(np.eye(2), P0, prec)
+    assert linalgPP.Loewner_le(P0, P0, prec)
+
+def test_is_projector():
+    assert linalgPP.is_projector(np.array([[0.5, 0.5], [0.5, 0.5]]), prec)
+    assert linalgPP.is_projector(np.zeros((2, 2)), prec)
+    assert linalgPP.is_projector(np.eye(2), prec)
+    assert not linalgPP.is_projector(np.eye(2) / 2, prec)
+    # not Hermitian
+    assert not linalgPP.is_projector(np.array([[1., 1.], [0., 0.]]), prec)
+
+def test_is_spd_large():
+    # large enough to go through the Cholesky fast path
+    rng = np.random.default_rng(0)
+    X = rng.normal(size = (32, 32)) + 1j * rng.normal(size = (32, 32))
+    rho = X @ X.transpose().conj()
+    rho /= np.trace(rho).real
+    assert linalgPP.is_spd(rho, prec)
+    assert linalgPP.is_pdo(rho, prec)
+    # a projector has zero eigenvalues, on the semi-definite boundary
+    assert linalgPP.is_spd(np.diag([1.] * 16 + [0.] * 16), prec)
+    assert not linalgPP.is_spd(rho - 0.5 * np.eye(32), prec)